@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
@@ -17,6 +20,32 @@ APP_VERSION = "v2.0.0"
 
 logger = logging.getLogger("statin_app")
 
+# The root payload never changes at runtime, so serialize it and derive its ETag once.
+_ROOT_BODY = json.dumps(
+    {
+        "service": "Statin Recommendation API",
+        "version": APP_VERSION,
+        "documentation_url": "/docs",
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+_ROOT_ETAG = f'"{hashlib.sha1(_ROOT_BODY).hexdigest()}"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison for If-None-Match (RFC 9110 §13.1.2): a ``W/`` prefix is ignored."""
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
 app = FastAPI(title="Statin Recommendation Service", version=APP_VERSION)
 
 # --- Add CORS Middleware ---
@@ -57,13 +86,12 @@ class ErrorResponse(BaseModel):
 # This makes it very clear for the frontend team what to expect.
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Provides basic information about the API."""
-    return {
-        "service": "Statin Recommendation API",
-        "version": APP_VERSION,
-        "documentation_url": "/docs",
-    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, _ROOT_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_ROOT_HEADERS)
+    return Response(content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 @app.post(
@@ -79,6 +107,9 @@ async def root():
 )
 async def evaluate(payload: EvaluationPayload):
     try:
+        # JSON may carry NaN/Infinity into plain float fields; treat them as invalid input.
+        if not all(map(math.isfinite, (payload.ck_value, payload.transaminase, payload.bilirubin))):
+            raise ValueError("Lab values must be finite numbers.")
         recommendation = get_statin_recommendation(
             payload.ck_value,
             payload.transaminase,
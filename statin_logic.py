@@ -2,6 +2,27 @@ ULN_CK = 200  # Example CK ULN (U/L)
 ULN_ALT = 40  # Example ALT/AST ULN (U/L)
 BILIRUBIN_THRESHOLD = 2.0  # mg/dL
 
+# Derived thresholds, computed once instead of on every call
+CK_3X = 3 * ULN_CK
+CK_10X = 10 * ULN_CK
+ALT_3X = 3 * ULN_ALT
+
+# CK and myopathy messages
+CK_HIGH_MSG = "CK: Withdraw statin, hydrate, and monitor renal function."
+CK_MID_MSG = "CK: Withdraw statin. Consider nonstatin-related causes and modify risk factors."
+CK_LOW_SYMPTOMS_MSG = (
+    "CK: Withdraw statin. Consider nonstatin-related causes and modify risk factors.\n"
+    "- If symptoms resolve and CK returns to normal: reinitiate statin at a reduced dose or switch to an alternative statin.\n"
+    "- If CK remains elevated (>3x ULN) or symptoms persist: consult a specialist or consider muscle biopsy."
+)
+CK_LOW_MSG = "CK: Continue statin. Follow up CK in 2–4 weeks. Consider nonstatin-related causes and modify risk factors."
+
+# Liver function messages
+LIVER_NORMAL_MSG = "Liver: Start statin. Follow-up liver function test in 12 weeks."
+LIVER_MID_MSG = "Liver: Consider starting statin. Reassess liver function and bilirubin in 2–4 weeks."
+LIVER_MID_HIGH_BILIRUBIN_MSG = "Liver: Do not start statin. Bilirubin > 2 mg/dL. Consult hepatic experts."
+LIVER_HIGH_MSG = "Liver: Do not start statin. Transaminase > 3× ULN. Consult hepatic experts."
+
 def get_statin_recommendation(ck_value, transaminase, bilirubin, muscle_symptoms):
     """
     Evaluates clinical data and provides statin treatment recommendations.
@@ -15,36 +36,25 @@ def get_statin_recommendation(ck_value, transaminase, bilirubin, muscle_symptoms
     Returns:
         str: The statin treatment recommendation.
     """
-    result = ""
-
-    # CK and myopathy assessment
-    if ck_value > 10 * ULN_CK or (muscle_symptoms and ck_value > 10 * ULN_CK):
-        result += "CK: Withdraw statin, hydrate, and monitor renal function.\n\n"
-    elif 3 * ULN_CK < ck_value <= 10 * ULN_CK:
-        result += "CK: Withdraw statin. Consider nonstatin-related causes and modify risk factors.\n\n"
-    elif ck_value <= 3 * ULN_CK:
-        if muscle_symptoms:
-            result += (
-                "CK: Withdraw statin. Consider nonstatin-related causes and modify risk factors.\n"
-                "- If symptoms resolve and CK returns to normal: reinitiate statin at a reduced dose or switch to an alternative statin.\n"
-                "- If CK remains elevated (>3x ULN) or symptoms persist: consult a specialist or consider muscle biopsy.\n\n"
-            )
-        else:
-            result += (
-                "CK: Continue statin. Follow up CK in 2–4 weeks. Consider nonstatin-related causes and modify risk factors.\n\n"
-            )
-
     # Liver function assessment
     if transaminase <= ULN_ALT:
-        result += "Liver: Start statin. Follow-up liver function test in 12 weeks.\n"
-    elif ULN_ALT < transaminase <= 3 * ULN_ALT:
+        liver_msg = LIVER_NORMAL_MSG
+    elif transaminase <= ALT_3X:
         if bilirubin <= BILIRUBIN_THRESHOLD:
-            result += (
-                "Liver: Consider starting statin. Reassess liver function and bilirubin in 2–4 weeks.\n"
-            )
+            liver_msg = LIVER_MID_MSG
         else:
-            result += "Liver: Do not start statin. Bilirubin > 2 mg/dL. Consult hepatic experts.\n"
+            liver_msg = LIVER_MID_HIGH_BILIRUBIN_MSG
     else:  # transaminase > 3x ULN
-        result += "Liver: Do not start statin. Transaminase > 3× ULN. Consult hepatic experts.\n"
+        liver_msg = LIVER_HIGH_MSG
+
+    # CK and myopathy assessment
+    if ck_value <= CK_3X:
+        ck_msg = CK_LOW_SYMPTOMS_MSG if muscle_symptoms else CK_LOW_MSG
+    elif ck_value <= CK_10X:
+        ck_msg = CK_MID_MSG
+    elif ck_value > CK_10X:
+        ck_msg = CK_HIGH_MSG
+    else:  # NaN matches no CK band; as before, only the liver advice is given
+        return liver_msg
 
-    return result.strip() # Remove trailing newlines if any
\ No newline at end of file
+    return ck_msg + "\n\n" + liver_msg